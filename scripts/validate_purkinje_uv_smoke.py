@@ -7,8 +7,14 @@ end-to-end pipeline runs on realistic data before running the full workflow.
 What it does:
 1) Loads LV and RV cut-surface OBJ files.
 2) Chooses init/second nodes automatically (PCA-based) unless you provide them.
+   The apex is the PC1 extreme nearer the vertex centroid, independent of the
+   eigenvector sign the solver returns. Default seeds on the bundled meshes:
+   crtdemo LV (3, 173), crtdemo RV (206, 645), ellipsoid (0, 577); pass
+   --lv-seeds/--rv-seeds to override.
 3) Builds FractalTreeParameters with scale heuristics based on mesh size.
-4) Grows trees with shrink-and-retry on "out of domain" errors.
+4) Grows LV/RV trees (in 2 processes with --jobs 2). On "out of domain" errors
+   all lengths shrink by --shrink and growth is retried; with --refine-tol the
+   first fitting scale is then bisected back up towards the failing one.
 5) Validates outputs (shapes, index ranges, non-empty PMJs, finite coords).
 6) Saves LV/RV VTU + (optional) PMJ VTP.
 
@@ -21,10 +27,13 @@ python scripts/validate_purkinje_uv_smoke.py --lv ... --rv ... --lv-seeds 123 45
 from __future__ import annotations
 
 import argparse
-from dataclasses import replace
+import copy
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
+import multiprocessing
 import os
 from pathlib import Path
+import threading
 import time
 
 import numpy as np
@@ -33,7 +42,12 @@ from purkinje_uv.fractal_tree_parameters import FractalTreeParameters
 from purkinje_uv.fractal_tree import FractalTree
 from purkinje_uv.purkinje_tree import PurkinjeTree
 from purkinje_uv.mesh import Mesh
+from purkinje_uv.config import is_gpu
 
+try:  # Optional: fused JIT kernel for PCA seeding on large meshes.
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is not a dependency
+    njit = None
 
 LOGGER = logging.getLogger(__name__)
 
@@ -48,12 +62,14 @@ def _resolve_log_level(level: str | int) -> int:
 
 
 def configure_logging(level: str) -> None:
-    """Configure console logging for the smoke test."""
-    fmt = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-    datefmt = "%H:%M:%S"
+    """Configure console logging for the smoke test (safe to call repeatedly)."""
     resolved = _resolve_log_level(level)
-    logging.basicConfig(level=resolved, format=fmt, datefmt=datefmt)
-    logging.getLogger().setLevel(resolved)
+    root = logging.getLogger()
+    if not root.handlers:
+        fmt = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+        datefmt = "%H:%M:%S"
+        logging.basicConfig(level=resolved, format=fmt, datefmt=datefmt)
+    root.setLevel(resolved)
     if not isinstance(getattr(logging, str(level).upper(), None), int):
         LOGGER.warning("Unknown log level %r; defaulting to INFO.", level)
 
@@ -64,10 +80,81 @@ def require(condition: bool, label: str, message: str) -> None:
         raise ValueError(f"{label}: {message}")
 
 
+# Below this size the one-off JIT compile costs more than it saves.
+_NUMBA_MIN_VERTS = 200_000
+# main() seeds LV and RV on two threads; numba's default workqueue threading
+# layer aborts on concurrent parallel launches, so kernel calls take turns.
+_NUMBA_LOCK = threading.Lock()
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _pca_seed_kernel(v):  # pragma: no cover - requires numba
+        """Fused PCA projection + squared distances to the apex-side extreme."""
+        n = v.shape[0]
+        sx = 0.0
+        sy = 0.0
+        sz = 0.0
+        for i in prange(n):
+            sx += v[i, 0]
+            sy += v[i, 1]
+            sz += v[i, 2]
+        cx = sx / n
+        cy = sy / n
+        cz = sz / n
+
+        cxx = 0.0
+        cxy = 0.0
+        cxz = 0.0
+        cyy = 0.0
+        cyz = 0.0
+        czz = 0.0
+        for i in prange(n):
+            x = v[i, 0] - cx
+            y = v[i, 1] - cy
+            z = v[i, 2] - cz
+            cxx += x * x
+            cxy += x * y
+            cxz += x * z
+            cyy += y * y
+            cyz += y * z
+            czz += z * z
+        C = np.array([[cxx, cxy, cxz], [cxy, cyy, cyz], [cxz, cyz, czz]])
+        _, V = np.linalg.eigh(C)
+        pc1 = V[:, 2].copy()
+
+        proj = np.empty(n)
+        for i in prange(n):
+            proj[i] = (
+                (v[i, 0] - cx) * pc1[0]
+                + (v[i, 1] - cy) * pc1[1]
+                + (v[i, 2] - cz) * pc1[2]
+            )
+        # Orientation rule shared with the numpy path (see pca_seed_vertices).
+        if -proj.min() > proj.max():
+            for i in prange(n):
+                proj[i] = -proj[i]
+        init = np.argmin(proj)
+
+        d2 = np.empty(n)
+        for i in prange(n):
+            dx = v[i, 0] - v[init, 0]
+            dy = v[i, 1] - v[init, 1]
+            dz = v[i, 2] - v[init, 2]
+            d2[i] = dx * dx + dy * dy + dz * dz
+        return proj, d2, init
+
+else:
+    _pca_seed_kernel = None
+
+
 def pca_seed_vertices(verts: np.ndarray, k_nn: int = 30) -> tuple[int, int]:
     """
     Pick (init_node_id, second_node_id) from vertices using PCA axis.
 
+    PC1 is oriented so that its negative end is the extreme nearer the vertex
+    centroid; this makes the result independent of the eigenvector's sign.
+
     init = extreme on -PC1 (apex-like)
     second = among k nearest neighbors of init, the one with largest projection along +PC1
     """
@@ -76,31 +163,47 @@ def pca_seed_vertices(verts: np.ndarray, k_nn: int = 30) -> tuple[int, int]:
         "PCA",
         f"verts must be (N, 3), got {verts.shape}",
     )
-    v = verts.astype(np.float64)
-    c = v.mean(axis=0)
-    X = v - c
-
-    # PCA via SVD: use PC1 as the dominant long axis.
-    _, _, vh = np.linalg.svd(X, full_matrices=False)
-    pc1 = vh[0]  # (3,)
+    v = np.ascontiguousarray(verts, dtype=np.float64)  # no copy if already f64
 
-    proj = X @ pc1
-    init = int(np.argmin(proj))
-
-    # Nearest neighbors of init (brute force is OK for a smoke test).
-    d2 = np.sum((v - v[init]) ** 2, axis=1)
-    nn = np.argsort(d2)[: max(k_nn, 3)]
+    if _pca_seed_kernel is not None and v.shape[0] >= _NUMBA_MIN_VERTS:
+        # Same steps as below, fused into parallel passes without (N, 3) temps.
+        with _NUMBA_LOCK:
+            proj, d2, init = _pca_seed_kernel(v)
+        init = int(init)
+    else:
+        c = v.mean(axis=0)
+        X = v - c
+
+        # PCA via the 3x3 scatter matrix: PC1 is the eigenvector of the largest
+        # eigenvalue (eigh sorts ascending). Avoids an SVD over all N rows.
+        C = np.dot(X.T, X)
+        _, V = np.linalg.eigh(C)
+        pc1 = V[:, -1]  # (3,)
+
+        proj = X @ pc1
+        # Eigenvector signs are arbitrary: orient PC1 so the apex end is -PC1.
+        if -proj.min() > proj.max():
+            proj = -proj
+        init = int(np.argmin(proj))
+
+        # Nearest neighbors of init (brute force is OK for a smoke test).
+        # Centering cancels out of the difference, so reuse X instead of v.
+        diff = X - X[init]
+        d2 = np.einsum("ij,ij->i", diff, diff)
+
+    # Only the k closest are needed and their order is irrelevant below.
+    k = min(max(k_nn, 3), d2.size)
+    nn = np.argpartition(d2, k - 1)[:k]
 
     # Choose second as neighbor "going forward" along PC1.
     nn_proj = proj[nn]
     second = int(nn[int(np.argmax(nn_proj))])
 
     if second == init:
-        # Fallback: take 2nd closest distinct.
-        for idx in nn:
-            if int(idx) != init:
-                second = int(idx)
-                break
+        # Fallback: take the closest distinct neighbor (nn is unordered).
+        others = nn[nn != init]
+        if others.size:
+            second = int(others[int(np.argmin(d2[others]))])
 
     return init, second
 
@@ -112,9 +215,7 @@ def mesh_size_diameter(verts: np.ndarray) -> float:
         "MESH",
         f"verts must be (N, 3), got {verts.shape}",
     )
-    mn = verts.min(axis=0)
-    mx = verts.max(axis=0)
-    return float(np.linalg.norm(mx - mn))
+    return float(np.linalg.norm(np.ptp(verts, axis=0)))
 
 
 def validate_seeds(label: str, seeds: tuple[int, int], n_verts: int) -> None:
@@ -131,11 +232,16 @@ def validate_seeds(label: str, seeds: tuple[int, int], n_verts: int) -> None:
 
 
 def build_params(
-    meshfile: Path, seeds: tuple[int, int], diag: float
+    meshfile: Path,
+    seeds: tuple[int, int],
+    diag: float,
+    mesh: Mesh | None = None,
 ) -> FractalTreeParameters:
     """
     Heuristic scale based on mesh bounding-box diagonal.
     Values are "reasonable starters"; the retry loop shrinks if needed.
+    Passing the already-loaded ``mesh`` spares FractalTree re-reading the OBJ
+    on every attempt.
     """
     init, second = seeds
 
@@ -156,28 +262,82 @@ def build_params(
         l_segment=float(l_segment),
         fascicles_angles=[0.02, 0.03],
         fascicles_length=[0.05 * diag, 0.08 * diag],
+        mesh=mesh,
     )
     return params
 
 
+def _scaled_params(base: FractalTreeParameters, scale: float) -> FractalTreeParameters:
+    """
+    Copy ``base`` with all growth lengths multiplied by ``scale`` in (0, 1].
+
+    Scaling every length by the same factor keeps the validated invariants
+    (positivity, l_segment <= lengths), so the copy skips __post_init__.
+    """
+    p = copy.copy(base)
+    p.init_length = float(base.init_length * scale)
+    p.length = float(base.length * scale)
+    p.l_segment = float(base.l_segment * scale)
+    # One vectorized multiply; tolist() yields plain floats (JSON-friendly).
+    p.fascicles_length = (
+        np.asarray(base.fascicles_length, dtype=np.float64) * scale
+    ).tolist()
+    return p
+
+
 def grow_with_retry(
     params: FractalTreeParameters,
     *,
     label: str,
     max_tries: int = 12,
     shrink: float = 0.85,
+    refine_tol: float | None = None,
 ) -> tuple[FractalTreeParameters, FractalTree]:
     """
     Grow a tree; if it fails with "out of the domain" shrink lengths and retry.
+
+    Each failure multiplies all lengths by ``shrink``, and by default the
+    first tree that fits is returned. With ``refine_tol``, the gap between
+    that fit and the smallest failing scale is then bisected upwards until it
+    is within ``refine_tol`` (relative) of the failure, or ``max_tries``
+    growths are spent.
     """
-    p = params
+    scale = 1.0
+    lo, hi = 0.0, 1.0  # largest success / smallest failure seen so far
+    failed = False
+    best: tuple[FractalTreeParameters, FractalTree] | None = None
     last_err: Exception | None = None
 
     for i in range(max_tries):
+        p = _scaled_params(params, scale)
         try:
-            LOGGER.info("[%s] Grow attempt %d/%d", label, i + 1, max_tries)
+            LOGGER.info(
+                "[%s] Grow attempt %d/%d (scale=%.4g)", label, i + 1, max_tries, scale
+            )
             ft = FractalTree(p)
             ft.grow_tree()
+        except Exception as e:
+            last_err = e
+            msg = str(e).lower()
+
+            # Legacy algorithm often throws "out of the domain".
+            if "out of the domain" not in msg and "domain" not in msg:
+                if best is not None:
+                    # Only optional refinement is lost; keep the tree we have.
+                    LOGGER.exception(
+                        "[%s] Refinement failed with unexpected error; "
+                        "keeping scale=%.4g.",
+                        label,
+                        lo,
+                    )
+                    break
+                # Unknown error -> rethrow.
+                LOGGER.exception("[%s] Grow failed with unexpected error.", label)
+                raise
+
+            LOGGER.warning("[%s] Grow failed at scale=%.4g (%s).", label, scale, e)
+            hi, failed = scale, True
+        else:
             LOGGER.info(
                 "[%s] Growth succeeded (nodes=%d edges=%d pmj=%d)",
                 label,
@@ -185,43 +345,30 @@ def grow_with_retry(
                 len(ft.connectivity),
                 len(ft.end_nodes),
             )
-            return p, ft  # success
-        except Exception as e:
-            last_err = e
-            msg = str(e).lower()
+            best, lo = (p, ft), scale
+            if not failed or refine_tol is None:
+                break  # nothing larger left to try / refinement not requested
+
+        if best is None:
+            scale *= shrink
+            continue
+        # Past the first success only when refining, so refine_tol is set.
+        if hi - lo <= refine_tol * hi:
+            break
+        scale = 0.5 * (lo + hi)
+        LOGGER.debug(
+            "[%s] Next scale=%.4g (success<=%.4g, failure>=%.4g)",
+            label,
+            scale,
+            lo,
+            hi,
+        )
 
-            # Legacy algorithm often throws "out of the domain".
-            if "out of the domain" in msg or "domain" in msg:
-                LOGGER.warning(
-                    "[%s] Grow failed (%s); shrinking lengths by %.2f and retrying.",
-                    label,
-                    e,
-                    shrink,
-                )
-                # Shrink geometric step scales.
-                p = replace(
-                    p,
-                    init_length=float(p.init_length * shrink),
-                    length=float(p.length * shrink),
-                    l_segment=float(p.l_segment * shrink),
-                    fascicles_length=[float(x * shrink) for x in p.fascicles_length],
-                )
-                LOGGER.debug(
-                    "[%s] Shrunk params: init_length=%.6g length=%.6g l_segment=%.6g",
-                    label,
-                    p.init_length,
-                    p.length,
-                    p.l_segment,
-                )
-                continue
-
-            # Unknown error -> rethrow.
-            LOGGER.exception("[%s] Grow failed with unexpected error.", label)
-            raise
-
-    raise RuntimeError(
-        f"Failed to grow tree after {max_tries} attempts. Last error: {last_err}"
-    )
+    if best is None:
+        raise RuntimeError(
+            f"Failed to grow tree after {max_tries} attempts. Last error: {last_err}"
+        )
+    return best
 
 
 def tree_arrays(ft: FractalTree) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -232,6 +379,33 @@ def tree_arrays(ft: FractalTree) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     return nodes, edges, pmj
 
 
+def grow_tree_arrays(
+    params: FractalTreeParameters,
+    *,
+    label: str,
+    max_tries: int = 12,
+    shrink: float = 0.85,
+    refine_tol: float | None = None,
+) -> tuple[FractalTreeParameters, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Process-pool worker: grow with retry and return only picklable results.
+
+    FractalTree holds a VTK cell locator, which cannot cross a process
+    boundary, so the tree is converted to arrays inside the worker. The
+    preloaded mesh is dropped from the returned params: the parent already
+    has it and would otherwise receive a pickled copy (plus UV data) back.
+    """
+    p, ft = grow_with_retry(
+        params,
+        label=label,
+        max_tries=max_tries,
+        shrink=shrink,
+        refine_tol=refine_tol,
+    )
+    p.mesh = None
+    return p, tree_arrays(ft)
+
+
 def validate_outputs(
     nodes: np.ndarray, edges: np.ndarray, pmj: np.ndarray, label: str
 ) -> None:
@@ -250,14 +424,24 @@ def validate_outputs(
     require(edges.shape[0] > 10, label, f"too few edges: {edges.shape[0]}")
     require(pmj.size > 0, label, "PMJs empty")
 
-    require(np.isfinite(nodes).all(), label, "NaN/Inf in nodes")
+    # NaN/Inf propagate through a sum, so one scalar check replaces a full
+    # boolean mask (only overflow near float64 max could false-positive).
+    require(bool(np.isfinite(nodes.sum())), label, "NaN/Inf in nodes")
     require(
-        np.all(edges >= 0) and np.all(edges < nodes.shape[0]),
+        edges.dtype == np.int64 and pmj.dtype == np.int64,
+        label,
+        f"index arrays must be int64, got {edges.dtype}/{pmj.dtype}",
+    )
+    # Reinterpreted as uint64, negative indices become huge values, so one
+    # comparison checks both bounds in a single pass.
+    n = np.uint64(nodes.shape[0])
+    require(
+        bool((edges.view(np.uint64) < n).all()),
         label,
         "edge index out of range",
     )
     require(
-        np.all(pmj >= 0) and np.all(pmj < nodes.shape[0]),
+        bool((pmj.view(np.uint64) < n).all()),
         label,
         "PMJ index out of range",
     )
@@ -269,8 +453,12 @@ def _pv_faces(connectivity: np.ndarray) -> np.ndarray:
     require(
         conn.ndim == 2 and conn.shape[1] == 3, "VIS", "tri connectivity must be (T, 3)"
     )
-    faces = np.hstack([np.full((conn.shape[0], 1), 3, dtype=np.int64), conn])
-    return faces.ravel()
+    # Write the flat [3, i0, i1, i2, 3, ...] stream directly: strided fill of
+    # the cell sizes, then the connectivity through a (T, 4) view.
+    faces = np.empty(conn.shape[0] * 4, dtype=np.int64)
+    faces[0::4] = 3
+    faces.reshape(-1, 4)[:, 1:] = conn
+    return faces
 
 
 def _pv_lines(edges: np.ndarray) -> np.ndarray:
@@ -279,8 +467,10 @@ def _pv_lines(edges: np.ndarray) -> np.ndarray:
     require(
         conn.ndim == 2 and conn.shape[1] == 2, "VIS", "edge connectivity must be (E, 2)"
     )
-    lines = np.hstack([np.full((conn.shape[0], 1), 2, dtype=np.int64), conn])
-    return lines.ravel()
+    lines = np.empty(conn.shape[0] * 3, dtype=np.int64)
+    lines[0::3] = 2
+    lines.reshape(-1, 3)[:, 1:] = conn
+    return lines
 
 
 def visualize_results(
@@ -380,6 +570,18 @@ def main() -> None:
     ap.add_argument(
         "--rv-seeds", type=int, nargs=2, default=None, metavar=("INIT", "SECOND")
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        choices=(1, 2),
+        default=1,
+        help=(
+            "Grow LV and RV in 2 worker processes instead of one after the other. "
+            "Only pays off for large meshes: each worker receives a pickled copy "
+            "of its mesh (and re-imports the package when CuPy forces spawn) "
+            "[default: 1]"
+        ),
+    )
     ap.add_argument(
         "--max-tries",
         type=int,
@@ -392,6 +594,16 @@ def main() -> None:
         default=0.85,
         help="Shrink factor applied to lengths on retry [default: 0.85]",
     )
+    ap.add_argument(
+        "--refine-tol",
+        type=float,
+        default=None,
+        help=(
+            "After a retry fits, bisect back up until the fitting length scale "
+            "is within this relative tolerance of the failing one "
+            "[default: off, keep the first fit]"
+        ),
+    )
     ap.add_argument(
         "--log-level",
         type=str,
@@ -430,6 +642,11 @@ def main() -> None:
         "CONFIG",
         f"shrink must be in (0, 1], got {args.shrink}",
     )
+    require(
+        args.refine_tol is None or 0.0 < args.refine_tol < 1.0,
+        "CONFIG",
+        f"refine-tol must be in (0, 1), got {args.refine_tol}",
+    )
 
     out = Path(args.out)
     out.mkdir(parents=True, exist_ok=True)
@@ -441,38 +658,55 @@ def main() -> None:
     if not rv_path.is_file():
         raise FileNotFoundError(f"RV mesh not found: {rv_path}")
 
-    # Load meshes (verts only) via purkinje_uv.Mesh to match internal indexing.
-    lv_mesh = Mesh(filename=str(lv_path))
-    rv_mesh = Mesh(filename=str(rv_path))
-    LOGGER.info(
-        "[LV] verts=%d tris=%d",
-        lv_mesh.verts.shape[0],
-        lv_mesh.connectivity.shape[0],
-    )
-    LOGGER.info(
-        "[RV] verts=%d tris=%d",
-        rv_mesh.verts.shape[0],
-        rv_mesh.connectivity.shape[0],
-    )
-
-    lv_diag = mesh_size_diameter(lv_mesh.verts)
-    rv_diag = mesh_size_diameter(rv_mesh.verts)
-    require(lv_diag > 0.0, "LV", "mesh diagonal is zero")
-    require(rv_diag > 0.0, "RV", "mesh diagonal is zero")
+    # LV and RV preprocessing is independent: overlap mesh loading (and PCA
+    # seeding, when requested) on two threads.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        # Load meshes via purkinje_uv.Mesh to match internal indexing.
+        f_lv_mesh = ex.submit(Mesh, filename=str(lv_path))
+        f_rv_mesh = ex.submit(Mesh, filename=str(rv_path))
+        lv_mesh = f_lv_mesh.result()
+        rv_mesh = f_rv_mesh.result()
+
+        f_lv_seeds = (
+            ex.submit(pca_seed_vertices, lv_mesh.verts)
+            if args.lv_seeds is None
+            else None
+        )
+        f_rv_seeds = (
+            ex.submit(pca_seed_vertices, rv_mesh.verts)
+            if args.rv_seeds is None
+            else None
+        )
 
-    if args.lv_seeds is not None:
-        lv_seeds = tuple(args.lv_seeds)
-        lv_seed_source = "cli"
-    else:
-        lv_seeds = pca_seed_vertices(lv_mesh.verts)
-        lv_seed_source = "pca"
+        LOGGER.info(
+            "[LV] verts=%d tris=%d",
+            lv_mesh.verts.shape[0],
+            lv_mesh.connectivity.shape[0],
+        )
+        LOGGER.info(
+            "[RV] verts=%d tris=%d",
+            rv_mesh.verts.shape[0],
+            rv_mesh.connectivity.shape[0],
+        )
 
-    if args.rv_seeds is not None:
-        rv_seeds = tuple(args.rv_seeds)
-        rv_seed_source = "cli"
-    else:
-        rv_seeds = pca_seed_vertices(rv_mesh.verts)
-        rv_seed_source = "pca"
+        lv_diag = mesh_size_diameter(lv_mesh.verts)
+        rv_diag = mesh_size_diameter(rv_mesh.verts)
+        require(lv_diag > 0.0, "LV", "mesh diagonal is zero")
+        require(rv_diag > 0.0, "RV", "mesh diagonal is zero")
+
+        if f_lv_seeds is None:
+            lv_seeds = tuple(args.lv_seeds)
+            lv_seed_source = "cli"
+        else:
+            lv_seeds = f_lv_seeds.result()
+            lv_seed_source = "pca"
+
+        if f_rv_seeds is None:
+            rv_seeds = tuple(args.rv_seeds)
+            rv_seed_source = "cli"
+        else:
+            rv_seeds = f_rv_seeds.result()
+            rv_seed_source = "pca"
 
     validate_seeds("LV", lv_seeds, lv_mesh.verts.shape[0])
     validate_seeds("RV", rv_seeds, rv_mesh.verts.shape[0])
@@ -491,8 +725,8 @@ def main() -> None:
     )
 
     # Build params (start) + retry shrink if needed.
-    p_lv0 = build_params(lv_path, lv_seeds, lv_diag)
-    p_rv0 = build_params(rv_path, rv_seeds, rv_diag)
+    p_lv0 = build_params(lv_path, lv_seeds, lv_diag, mesh=lv_mesh)
+    p_rv0 = build_params(rv_path, rv_seeds, rv_diag, mesh=rv_mesh)
 
     LOGGER.info(
         "[LV] params: init_length=%.6g length=%.6g l_segment=%.6g N_it=%d",
@@ -509,18 +743,32 @@ def main() -> None:
         p_rv0.N_it,
     )
 
-    p_lv, ft_lv = grow_with_retry(
-        p_lv0,
-        label="LV",
-        max_tries=args.max_tries,
-        shrink=args.shrink,
-    )
-    p_rv, ft_rv = grow_with_retry(
-        p_rv0,
-        label="RV",
-        max_tries=args.max_tries,
-        shrink=args.shrink,
-    )
+    grow_kwargs = dict(
+        max_tries=args.max_tries, shrink=args.shrink, refine_tol=args.refine_tol
+    )
+    if args.jobs > 1:
+        # LV and RV growth are independent: grow them in two processes. Worth
+        # it only for large meshes, since each worker receives a pickled Mesh.
+        # Fork is cheapest, but a forked child cannot use a CUDA context that
+        # already exists in the parent, so spawn when CuPy is active.
+        ctx = multiprocessing.get_context("spawn") if is_gpu() else None
+        with ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=ctx,
+            initializer=configure_logging,
+            initargs=(args.log_level,),
+        ) as ex:
+            f_lv = ex.submit(grow_tree_arrays, p_lv0, label="LV", **grow_kwargs)
+            f_rv = ex.submit(grow_tree_arrays, p_rv0, label="RV", **grow_kwargs)
+            p_lv, (lv_nodes, lv_edges, lv_pmj) = f_lv.result()
+            p_rv, (rv_nodes, rv_edges, rv_pmj) = f_rv.result()
+    else:
+        p_lv, (lv_nodes, lv_edges, lv_pmj) = grow_tree_arrays(
+            p_lv0, label="LV", **grow_kwargs
+        )
+        p_rv, (rv_nodes, rv_edges, rv_pmj) = grow_tree_arrays(
+            p_rv0, label="RV", **grow_kwargs
+        )
 
     LOGGER.info(
         "[LV] final params: init_length=%.6g length=%.6g l_segment=%.6g N_it=%d",
@@ -537,10 +785,6 @@ def main() -> None:
         p_rv.N_it,
     )
 
-    # Convert grown trees to arrays for validation/output.
-    lv_nodes, lv_edges, lv_pmj = tree_arrays(ft_lv)
-    rv_nodes, rv_edges, rv_pmj = tree_arrays(ft_rv)
-
     validate_outputs(lv_nodes, lv_edges, lv_pmj, "LV")
     validate_outputs(rv_nodes, rv_edges, rv_pmj, "RV")
 
@@ -34,7 +34,8 @@ class FractalTree:
         """Initialize the fractal tree generator.
 
         This:
-        - loads the 3D mesh and computes UV + UV-scaling (via :class:`Mesh`),
+        - loads the 3D mesh (or reuses ``params.mesh``) and computes UV + UV-scaling
+          (via :class:`Mesh`),
         - builds a “flattened UV” mesh (z=0) with the same connectivity,
         - constructs a VTK cell locator over the flattened mesh for closest-point queries,
         - precomputes a node-wise scaling proxy (area-weighted from triangle metrics).
@@ -49,10 +50,16 @@ class FractalTree:
         self.params = params
         _LOGGER.info("FractalTree: initializing (backend=%s)", backend_name())
 
-        # Load 3D surface mesh and compute UV+scaling (Mesh handles GPU where possible)
-        self.m = Mesh(params.meshfile)
-        _LOGGER.debug("FractalTree: computing UV-scaling via Mesh...")
-        self.m.compute_uvscaling()
+        # Load 3D surface mesh (or reuse a preloaded one) and compute UV+scaling
+        # (Mesh handles GPU where possible)
+        if params.mesh is not None:
+            self.m = params.mesh
+            _LOGGER.debug("FractalTree: using preloaded Mesh from params.")
+        else:
+            self.m = Mesh(params.meshfile)
+        if self.m.uv is None or self.m.uvscaling is None:
+            _LOGGER.debug("FractalTree: computing UV-scaling via Mesh...")
+            self.m.compute_uvscaling()
 
         if self.m.uv is None or self.m.uvscaling is None:
             # Mesh.compute_uvscaling guarantees both; guard anyway.
@@ -72,8 +79,16 @@ class FractalTree:
 
         # VTK locator over the flattened UV surface (CPU-side legacy behavior)
         try:
-            mpv = pv.read(params.meshfile)
-            mpv.points = self.mesh_uv.verts  # overwrite with flattened UV points
+            if params.mesh is None:
+                mpv = pv.read(params.meshfile)
+                mpv.points = self.mesh_uv.verts  # overwrite with flattened UV points
+            else:
+                # Same cells as Mesh.connectivity, so no second file read.
+                tris = np.asarray(self.m.connectivity, dtype=np.int64)
+                faces = np.empty((tris.shape[0], 4), dtype=np.int64)
+                faces[:, 0] = 3
+                faces[:, 1:] = tris
+                mpv = pv.PolyData(self.mesh_uv.verts, faces.ravel())
             self.loc = vtk.vtkCellLocator()
             self.loc.SetDataSet(mpv)
             self.loc.BuildLocator()
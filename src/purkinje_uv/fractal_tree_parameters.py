@@ -3,19 +3,82 @@
 This module provides the FractalTreeParameters dataclass, which holds all settings
 for generating a fractal tree structure.
 """
+
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import math
-from dataclasses import dataclass, field, asdict, fields
+from dataclasses import dataclass, field, fields
 from numbers import Real
-from typing import Any, Dict, List, Mapping, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .mesh import Mesh
+
+try:  # Optional C-accelerated JSON backend; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(slots=True, frozen=False)
+def _json_dumps(data: Mapping[str, Any], indent: Optional[int]) -> str:
+    """Serialize with orjson when it can honor ``indent`` (None or 2).
+
+    Both backends emit the same values and layout, but not always the same
+    text: float spelling differs (orjson writes ``1e-05`` as ``0.00001`` and
+    ``1e+16`` as ``1e16``). Compare parsed values, not strings.
+    """
+    if orjson is not None and indent in (None, 2):
+        # No OPT_SERIALIZE_NUMPY: accept exactly what the stdlib path accepts.
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        try:
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. float subclasses orjson rejects; stdlib handles them
+    # Compact output drops the blanks after separators, like orjson.
+    separators = (",", ":") if indent is None else None
+    return json.dumps(data, ensure_ascii=False, indent=indent, separators=separators)
+
+
+def _json_loads(s: str) -> Any:
+    return orjson.loads(s) if orjson is not None else json.loads(s)
+
+
+def _all_finite_reals(values: Sequence[Any], positive: bool = False) -> bool:
+    """Vectorized fast path: True if ``values`` is a flat list of finite numbers.
+
+    Only int/float arrays are accepted here; anything else (bools, strings,
+    Fractions, NaN, ...) returns False so the caller's per-element loop decides
+    and reports the offending index.
+    """
+    try:
+        arr = np.asarray(values)
+    except (ValueError, TypeError):  # e.g. ragged nesting
+        return False
+    if arr.ndim != 1 or arr.dtype.kind not in "iuf":
+        return False
+    ok = np.isfinite(arr) if arr.dtype.kind == "f" else np.ones(arr.shape, bool)
+    if positive:
+        ok &= arr > 0
+    return bool(ok.all())
+
+
+@dataclass(slots=True, eq=True, frozen=False)
 class FractalTreeParameters:
     """Holds settings for generating a fractal tree structure.
 
@@ -43,6 +106,9 @@ class FractalTreeParameters:
         Angles (in radians) for each fascicle branch.
     fascicles_length:
         Lengths for each fascicle branch; matches ``fascicles_angles``.
+    mesh:
+        Optional already-loaded :class:`Mesh`; when set, :class:`FractalTree`
+        uses it instead of reading ``meshfile``. Not serialized or compared.
     """
 
     meshfile: Optional[str] = None
@@ -65,8 +131,51 @@ class FractalTreeParameters:
 
     save: bool = False
 
+    # Preloaded surface mesh (runtime-only: excluded from to_dict/JSON and ==)
+    mesh: Optional[Mesh] = field(default=None, repr=False, compare=False)
+    # Set False for derived copies (e.g. dataclasses.replace in retry loops) to
+    # skip the INFO summary on construction; runtime-only like ``mesh``.
+    _log_init: bool = field(default=True, repr=False, compare=False)
+
     def __post_init__(self) -> None:
-        # --- Type checks for indices ---
+        # Cheapest checks first (ids, scalars, then lists); nothing is logged
+        # until every check has passed, so invalid inputs never format ``self``.
+        self._validate_only(None)
+
+        # --- Logging (summary at INFO, full at DEBUG) ---
+        if self._log_init and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Initialized FractalTreeParameters: meshfile=%r, init_node_id=%d, "
+                "second_node_id=%d, N_it=%d, init_length=%.6g, length=%.6g, "
+                "branch_angle=%.6g rad, w=%.6g, l_segment=%.6g, "
+                "fascicles=(%d items)",
+                self.meshfile,
+                self.init_node_id,
+                self.second_node_id,
+                self.N_it,
+                self.init_length,
+                self.length,
+                self.branch_angle,
+                self.w,
+                self.l_segment,
+                len(self.fascicles_angles),
+            )
+        # The full config is formatted lazily (%r) and only when DEBUG is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("FractalTreeParameters full config: %r", self)
+
+    def _validate_only(self, names: Optional[Iterable[str]]) -> None:
+        """Run the validators touching ``names`` (all of them if ``None``)."""
+        if names is None:
+            for check, _ in _VALIDATORS:
+                check(self)
+            return
+        changed = set(names)
+        for check, watched in _VALIDATORS:
+            if not changed.isdisjoint(watched):
+                check(self)
+
+    def _check_ids(self) -> None:
         if not isinstance(self.init_node_id, int) or self.init_node_id < 0:
             raise TypeError("init_node_id must be a nonnegative integer.")
         if not isinstance(self.second_node_id, int) or self.second_node_id < 0:
@@ -74,17 +183,33 @@ class FractalTreeParameters:
         if self.second_node_id == self.init_node_id:
             raise ValueError("second_node_id must differ from init_node_id.")
 
-        # --- Scalar numeric validations ---
-        for name, val, cond, msg in (
-            ("init_length", self.init_length, self.init_length > 0, "must be > 0."),
-            ("N_it", self.N_it, self.N_it >= 0, "must be >= 0."),
-            ("length", self.length, self.length > 0, "must be > 0."),
-            ("w", self.w, self.w >= 0, "must be >= 0."),
-            ("l_segment", self.l_segment, self.l_segment > 0, "must be > 0."),
+    def _check_scalars(self) -> None:
+        # Unrolled: runs on every construction
+        isfinite = math.isfinite
+        if (
+            not isinstance(self.init_length, Real)
+            or not isfinite(self.init_length)
+            or self.init_length <= 0
+        ):
+            raise ValueError("init_length must be > 0.")
+        if not isinstance(self.N_it, Real) or not isfinite(self.N_it) or self.N_it < 0:
+            raise ValueError("N_it must be >= 0.")
+        if (
+            not isinstance(self.length, Real)
+            or not isfinite(self.length)
+            or self.length <= 0
         ):
-            if not isinstance(val, Real) or not math.isfinite(float(val)) or not cond:
-                raise ValueError(f"{name} {msg}")
+            raise ValueError("length must be > 0.")
+        if not isinstance(self.w, Real) or not isfinite(self.w) or self.w < 0:
+            raise ValueError("w must be >= 0.")
+        if (
+            not isinstance(self.l_segment, Real)
+            or not isfinite(self.l_segment)
+            or self.l_segment <= 0
+        ):
+            raise ValueError("l_segment must be > 0.")
 
+    def _check_branch_angle(self) -> None:
         if not isinstance(self.branch_angle, Real) or not math.isfinite(
             float(self.branch_angle)
         ):
@@ -92,6 +217,7 @@ class FractalTreeParameters:
         if not (0.0 < float(self.branch_angle) <= math.pi):
             raise ValueError("branch_angle must be in the interval (0, π].")
 
+    def _check_segment(self) -> None:
         # Reasonable geometric relation for segments vs. branch lengths
         min_len = min(float(self.init_length), float(self.length))
         if float(self.l_segment) > min_len:
@@ -100,70 +226,100 @@ class FractalTreeParameters:
                 f"Got l_segment={self.l_segment}, min={min_len}."
             )
 
-        # --- Fascicles consistency ---
+    def _check_fascicles(self) -> None:
         if len(self.fascicles_angles) != len(self.fascicles_length):
             raise ValueError(
                 "fascicles_angles and fascicles_length must have the same length."
             )
 
-        # Validate each fascicle entry
-        for i, ang in enumerate(self.fascicles_angles):
-            if not isinstance(ang, Real) or not math.isfinite(float(ang)):
-                raise TypeError(
-                    f"fascicles_angles[{i}] must be a finite real number (radians)."
-                )
-
-        for i, L in enumerate(self.fascicles_length):
-            if not isinstance(L, Real) or not math.isfinite(float(L)) or float(L) <= 0:
-                raise ValueError(
-                    f"fascicles_length[{i}] must be a finite positive number."
-                )
-        # --- Logging (summary at INFO, full at DEBUG) ---
-        logger.info(
-            "Initialized FractalTreeParameters: meshfile=%r, init_node_id=%d, "
-            "second_node_id=%d, N_it=%d, init_length=%.6g, length=%.6g, "
-            "branch_angle=%.6g rad, w=%.6g, l_segment=%.6g, "
-            "fascicles=(%d items)",
-            self.meshfile,
-            self.init_node_id,
-            self.second_node_id,
-            self.N_it,
-            self.init_length,
-            self.length,
-            self.branch_angle,
-            self.w,
-            self.l_segment,
-            len(self.fascicles_angles),
-        )
-        logger.debug("FractalTreeParameters full config: %s", self.to_json(indent=None))
+        # Validate each fascicle entry (numpy fast path; the loops only run
+        # when it rejects, to keep the exact type/index of the error)
+        if not _all_finite_reals(self.fascicles_angles):
+            for i, ang in enumerate(self.fascicles_angles):
+                if not isinstance(ang, Real) or not math.isfinite(float(ang)):
+                    raise TypeError(
+                        f"fascicles_angles[{i}] must be a finite real number (radians)."
+                    )
+
+        if not _all_finite_reals(self.fascicles_length, positive=True):
+            for i, L in enumerate(self.fascicles_length):
+                if (
+                    not isinstance(L, Real)
+                    or not math.isfinite(float(L))
+                    or float(L) <= 0
+                ):
+                    raise ValueError(
+                        f"fascicles_length[{i}] must be a finite positive number."
+                    )
+
+    def with_overrides(self, **overrides: Any) -> "FractalTreeParameters":
+        """Return a copy with ``overrides`` applied, re-validating only those.
+
+        Cheaper than :func:`dataclasses.replace` for an already-validated
+        instance: only the checks that involve an overridden field run, and
+        the INFO summary is not logged. Lists are shared with ``self`` unless
+        overridden. Unknown field names raise ``TypeError``, like ``replace``.
+        """
+        unknown = overrides.keys() - _ALL_FIELD_NAMES
+        if unknown:
+            raise TypeError(f"Unknown parameter fields: {sorted(unknown)}")
+        obj = copy.copy(self)
+        for name, value in overrides.items():
+            setattr(obj, name, value)
+        obj._validate_only(overrides)
+        return obj
 
     def to_dict(self) -> Dict[str, Any]:
-        """Return a JSON-serializable dictionary of the parameters."""
-        return asdict(self)
+        """Return a JSON-serializable dictionary of the parameters.
+
+        Values are not deep-copied: the ``fascicles_*`` lists are shared with
+        this instance, so copy them before mutating.
+        """
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
 
-    def to_json(self, indent: Optional[int] = 2) -> str:
+    def to_json(self, indent: Optional[int] = None) -> str:
         """Serialize parameters to a JSON string.
 
         Parameters
         ----------
         indent:
-            Indentation level for pretty printing. If ``None``, the result is compact.
+            Indentation level for pretty printing. Defaults to ``None``, which
+            gives compact single-line output; pass ``indent=2`` for humans.
+
+        Uses orjson when installed. The parsed values are the same either way,
+        but float spelling in the text can differ between the two backends.
         """
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+        return _json_dumps(self.to_dict(), indent)
 
     def to_json_file(self, path: str, indent: Optional[int] = 2) -> None:
         """Write parameters to a JSON file at ``path``."""
         with open(path, "w", encoding="utf-8") as f:
             f.write(self.to_json(indent=indent))
 
+    def to_msgpack(self) -> bytes:
+        """Serialize parameters to compact MessagePack bytes.
+
+        Meant for caches and inter-process payloads; use JSON for config files.
+        Requires the optional ``msgpack`` package.
+        """
+        import msgpack
+
+        packed: bytes = msgpack.packb(self.to_dict(), use_bin_type=True)
+        return packed
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "FractalTreeParameters":
         """Construct parameters from a dictionary.
 
         Unknown keys are ignored (emits a warning). Validation occurs in ``__post_init__``.
+        Runtime-only fields (``mesh``, ``_log_init``) are never read from data:
+        they are ignored with a warning, like unknown keys.
         """
-        valid = {f.name for f in fields(cls)}
-        unknown = [k for k in data.keys() if k not in valid]
+        valid = _FIELD_NAMES
+        runtime = [k for k in data.keys() if k in _RUNTIME_FIELDS]
+        if runtime:
+            logger.warning("Ignoring runtime-only parameter keys: %s", runtime)
+        unknown = [k for k in data.keys() if k not in valid and k not in runtime]
         if unknown:
             logger.warning("Ignoring unknown parameter keys: %s", unknown)
         filtered: Dict[str, Any] = {k: v for k, v in data.items() if k in valid}
@@ -172,4 +328,48 @@ class FractalTreeParameters:
     @classmethod
     def from_json(cls, s: str) -> "FractalTreeParameters":
         """Construct parameters from a JSON string."""
-        return cls.from_dict(json.loads(s))
+        return cls.from_dict(_json_loads(s))
+
+    @classmethod
+    def from_json_file(cls, path: str) -> "FractalTreeParameters":
+        """Construct parameters from a JSON file at ``path``.
+
+        Parsed with the same backend as :meth:`from_json`, so both accept
+        exactly the same inputs.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(_json_loads(f.read()))
+
+    @classmethod
+    def from_msgpack(cls, b: bytes) -> "FractalTreeParameters":
+        """Construct parameters from bytes produced by :meth:`to_msgpack`."""
+        import msgpack
+
+        return cls.from_dict(msgpack.unpackb(b, raw=False))
+
+
+# (validator, fields it reads), in __post_init__ order; see _validate_only.
+_VALIDATORS = (
+    (FractalTreeParameters._check_ids, frozenset({"init_node_id", "second_node_id"})),
+    (
+        FractalTreeParameters._check_scalars,
+        frozenset({"init_length", "N_it", "length", "w", "l_segment"}),
+    ),
+    (FractalTreeParameters._check_branch_angle, frozenset({"branch_angle"})),
+    (
+        FractalTreeParameters._check_segment,
+        frozenset({"init_length", "length", "l_segment"}),
+    ),
+    (
+        FractalTreeParameters._check_fascicles,
+        frozenset({"fascicles_angles", "fascicles_length"}),
+    ),
+)
+
+_ALL_FIELD_NAMES = frozenset(f.name for f in fields(FractalTreeParameters))
+
+# Runtime-only fields are kept out of to_dict()/JSON.
+_RUNTIME_FIELDS = frozenset({"mesh", "_log_init"})
+_FIELD_NAMES = tuple(
+    f.name for f in fields(FractalTreeParameters) if f.name not in _RUNTIME_FIELDS
+)
@@ -1,7 +1,9 @@
 from __future__ import annotations
+
 import pytest
 
 import numpy as np
+from purkinje_uv.fractal_tree_parameters import FractalTreeParameters
 from purkinje_uv.mesh import Mesh
 
 
@@ -62,3 +64,13 @@ def simple_triangle_mesh():
     )
     connectivity = np.array([[0, 1, 2]])  # One triangle
     return Mesh(verts=verts, connectivity=connectivity)
+
+
+@pytest.fixture(scope="session")
+def default_params() -> FractalTreeParameters:
+    """
+    One canonical default FractalTreeParameters shared by the session.
+
+    Treat it as read-only; derive variants with dataclasses.replace.
+    """
+    return FractalTreeParameters()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Iterator
 
@@ -7,6 +8,7 @@ import numpy as np
 import pytest
 
 from purkinje_uv.fractal_tree import FractalTree, FractalTreeParameters
+from purkinje_uv.mesh import Mesh
 
 
 # -------------------------
@@ -122,6 +124,20 @@ def test_eval_field_returns_valids(tree: FractalTree) -> None:
     assert np.isfinite(ppoint).all()
 
 
+def test_init_reuses_preloaded_mesh(
+    params: FractalTreeParameters, tree: FractalTree
+) -> None:
+    mesh = Mesh(params.meshfile)
+    ft = FractalTree(replace(params, meshfile=None, mesh=mesh))
+
+    assert ft.m is mesh
+    assert mesh.uvscaling is not None
+    assert np.allclose(ft.mesh_uv.verts, tree.mesh_uv.verts)
+    uv_pt = ft.mesh_uv.verts[0][:2]
+    assert ft._scaling(uv_pt) == tree._scaling(uv_pt)
+    assert ft._point_in_mesh_vtk(np.array([10.0, 10.0])) is False
+
+
 # -------------------------
 # Higher-level helpers (state + phases)
 # -------------------------
@@ -0,0 +1,51 @@
+"""Serialization microbenchmarks for FractalTreeParameters.
+
+Opt-in: set ``PURKINJE_UV_BENCHMARK=1`` and install ``pytest-benchmark``, e.g.
+
+    PURKINJE_UV_BENCHMARK=1 pytest tests/purkinje_uv/test_benchmarks.py \
+        --benchmark-only --benchmark-autosave
+
+and compare runs with ``--benchmark-compare``.
+"""
+
+import os
+
+import pytest
+
+if os.environ.get("PURKINJE_UV_BENCHMARK") != "1":
+    pytest.skip(
+        "benchmarks disabled (set PURKINJE_UV_BENCHMARK=1)", allow_module_level=True
+    )
+pytest.importorskip("pytest_benchmark")
+
+from purkinje_uv.fractal_tree_parameters import FractalTreeParameters
+
+pytestmark = pytest.mark.benchmark(group="serdes")
+
+SIZES = [0, 10, 1000]
+
+
+@pytest.fixture(params=SIZES, ids=[f"n={n}" for n in SIZES])
+def params(request: pytest.FixtureRequest) -> FractalTreeParameters:
+    n = request.param
+    return FractalTreeParameters(
+        fascicles_angles=[0.1] * n, fascicles_length=[0.01] * n, _log_init=False
+    )
+
+
+def test_bench_to_dict(benchmark, params: FractalTreeParameters):
+    benchmark(params.to_dict)
+
+
+def test_bench_from_dict(benchmark, params: FractalTreeParameters):
+    d = params.to_dict()
+    assert benchmark(FractalTreeParameters.from_dict, d) == params
+
+
+def test_bench_to_json(benchmark, params: FractalTreeParameters):
+    benchmark(params.to_json)
+
+
+def test_bench_from_json(benchmark, params: FractalTreeParameters):
+    s = params.to_json()
+    assert benchmark(FractalTreeParameters.from_json, s) == params
@@ -1,149 +1,298 @@
 from dataclasses import replace
+import json
 import logging
 import math
-from pathlib import Path
+from types import MappingProxyType
 
+import numpy as np
 import pytest
 
 from purkinje_uv.fractal_tree_parameters import FractalTreeParameters
+from purkinje_uv.fractal_tree_parameters import logger as _params_logger
+
+# caplog's handler already sits on the root logger, which these records reach
+# by propagation, so tests only adjust the module logger's level.
+_PARAMS_LOGGER = _params_logger.name
+
+DEFAULTS = [
+    ("meshfile", None),
+    ("init_node_id", 0),
+    ("second_node_id", 1),
+    ("init_length", 0.1),
+    ("N_it", 10),
+    ("length", 0.1),
+    ("branch_angle", 0.15),
+    ("w", 0.1),
+    ("l_segment", 0.01),
+    ("fascicles_angles", []),
+    ("fascicles_length", []),
+]
+
+
+@pytest.mark.parametrize("field,expected", DEFAULTS, ids=[f for f, _ in DEFAULTS])
+def test_parameters_defaults(
+    default_params: FractalTreeParameters, field: str, expected: object
+):
+    value = getattr(default_params, field)
+    if isinstance(expected, list):
+        assert isinstance(value, list)
+    assert value == expected
 
 
-def test_parameters_defaults():
-    params = FractalTreeParameters()
-
-    assert params.meshfile is None
-    assert params.init_node_id == 0
-    assert params.second_node_id == 1
-    assert params.init_length == 0.1
-    assert params.N_it == 10
-    assert params.length == 0.1
-    assert params.branch_angle == 0.15
-    assert params.w == 0.1
-    assert params.l_segment == 0.01
-
-    assert isinstance(params.fascicles_angles, list)
-    assert isinstance(params.fascicles_length, list)
-    assert len(params.fascicles_angles) == 0
-    assert len(params.fascicles_length) == 0
+def test_parameters_slotted(default_params: FractalTreeParameters):
+    # Slots: no per-instance __dict__, and == compares fields via slot access
+    assert not hasattr(default_params, "__dict__")
+    assert default_params == FractalTreeParameters()
 
 
-def test_parameters_replace_construction():
-    base = FractalTreeParameters()
-    lseg = 0.01
-    out = replace(
-        base,
+def test_parameters_with_overrides(default_params: FractalTreeParameters):
+    base = default_params
+    overrides = dict(
         meshfile="mesh.obj",
         init_node_id=738,
         second_node_id=210,
-        l_segment=lseg,
+        l_segment=0.01,
         init_length=0.3,
         length=0.15,
-        fascicles_length=[20 * lseg, 40 * lseg],
+        fascicles_length=[0.2, 0.4],
         fascicles_angles=[-0.4, 0.5],
     )
+    # All values are literals (no arithmetic), so exact == is safe below.
+    out = base.with_overrides(**overrides)
     assert out.meshfile == "mesh.obj"
     assert out.init_node_id == 738
     assert out.second_node_id == 210
-    assert out.l_segment == pytest.approx(0.01)
-    assert out.init_length == pytest.approx(0.3)
-    assert out.length == pytest.approx(0.15)
+    assert (out.l_segment, out.init_length, out.length) == (0.01, 0.3, 0.15)
     assert out.fascicles_length == [0.2, 0.4]
     assert out.fascicles_angles == [-0.4, 0.5]
 
+    # Same result as the fully validating dataclasses.replace; base untouched
+    assert out == replace(base, **overrides)
+    assert base == FractalTreeParameters()
+
+
+@pytest.mark.parametrize(
+    "overrides,exc",
+    [
+        (dict(second_node_id=0), ValueError),  # collides with untouched init id
+        (dict(length=0.001), ValueError),  # now shorter than l_segment
+        (dict(fascicles_angles=[0.1]), ValueError),  # list lengths mismatch
+        (dict(no_such_field=1), TypeError),
+    ],
+    ids=["ids", "segment", "fascicles", "unknown"],
+)
+def test_with_overrides_invalid(
+    default_params: FractalTreeParameters, overrides: dict, exc: type[Exception]
+):
+    with pytest.raises(exc):
+        default_params.with_overrides(**overrides)
+
 
 # --- Validation error checks (from __post_init__) ---
 
+INVALID_CASES = [
+    (dict(init_length=0.0), ValueError),  # must be > 0
+    (dict(length=-0.1), ValueError),  # must be > 0
+    (dict(w=-0.01), ValueError),  # must be >= 0
+    (dict(l_segment=0.2, init_length=0.1, length=0.15), ValueError),
+    (dict(branch_angle=0.0), ValueError),
+    (dict(branch_angle=math.pi + 1.0), ValueError),
+    (dict(init_node_id=-1), TypeError),
+    (dict(second_node_id=-2), TypeError),
+    (dict(init_node_id=5, second_node_id=5), ValueError),
+    # Mismatch in list lengths
+    (dict(fascicles_angles=[0.1], fascicles_length=[]), ValueError),
+    # Nonpositive fascicle length
+    (dict(fascicles_angles=[0.1], fascicles_length=[0.0]), ValueError),
+    # Non-finite angle
+    (dict(fascicles_angles=[float("nan")], fascicles_length=[0.1]), TypeError),
+    # Numeric strings are rejected, not coerced
+    (dict(fascicles_angles=["0.1"], fascicles_length=[0.1]), TypeError),
+    # Ragged nesting is reported per element, not by numpy
+    (dict(fascicles_angles=[0.1, [0.2, 0.3]], fascicles_length=[0.1, 0.1]), TypeError),
+    (dict(fascicles_angles=[0.1], fascicles_length=[float("inf")]), ValueError),
+]
+
+
+@pytest.mark.parametrize(
+    "kwargs,exc",
+    INVALID_CASES,
+    ids=["-".join(f"{k}={v}" for k, v in kw.items()) for kw, _ in INVALID_CASES],
+)
+def test_parameters_invalid(
+    kwargs: dict, exc: type[Exception], caplog: pytest.LogCaptureFixture
+):
+    caplog.set_level(logging.DEBUG, logger=_PARAMS_LOGGER)
+    with pytest.raises(exc):
+        FractalTreeParameters(**kwargs)
+    # Validation fails before any logging (no summary/repr of a bad instance)
+    assert not caplog.records
+
+
+# Expected to_dict() of ``roundtrip_params`` (read-only, built once at import)
+_EXPECTED_DICT = MappingProxyType(
+    {
+        "meshfile": "mesh.obj",
+        "init_node_id": 2,
+        "second_node_id": 3,
+        "init_length": 0.25,
+        "N_it": 8,
+        "length": 0.12,
+        "branch_angle": 0.2,
+        "w": 0.05,
+        "l_segment": 0.01,
+        "fascicles_angles": [-0.3, 0.6],
+        "fascicles_length": [0.2, 0.4],
+        "save": False,
+    }
+)
+
+
+# Shared round-trip instance and its JSON forms, built once at import.
+# Tests must not mutate it; derive variants with dataclasses.replace.
+_ROUNDTRIP_PARAMS = FractalTreeParameters(
+    meshfile="mesh.obj",
+    init_node_id=2,
+    second_node_id=3,
+    init_length=0.25,
+    N_it=8,
+    length=0.12,
+    branch_angle=0.2,
+    w=0.05,
+    l_segment=0.01,
+    fascicles_angles=[-0.3, 0.6],
+    fascicles_length=[0.2, 0.4],
+)
+_JSON_PRETTY = _ROUNDTRIP_PARAMS.to_json(indent=2)
+_JSON_COMPACT = _ROUNDTRIP_PARAMS.to_json()  # compact is the default
+
+
+@pytest.fixture
+def roundtrip_params() -> FractalTreeParameters:
+    return _ROUNDTRIP_PARAMS
+
+
+def test_to_dict_roundtrip(roundtrip_params: FractalTreeParameters):
+    p = roundtrip_params
 
-def test_parameters_invalid_equal_node_ids():
-    with pytest.raises(ValueError):
-        FractalTreeParameters(init_node_id=5, second_node_id=5)
+    # dict contains all public fields and is JSON-serializable
+    d = p.to_dict()
+    assert isinstance(d, dict)
+    assert d == dict(_EXPECTED_DICT)
+
+    # dict -> object round-trip preserves equality (no JSON text involved)
+    assert FractalTreeParameters.from_dict(d) == p
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson"])
+@pytest.mark.parametrize(
+    "params",
+    [
+        _ROUNDTRIP_PARAMS,
+        # Floats whose text differs between backends (1e-05 vs 0.00001)
+        replace(_ROUNDTRIP_PARAMS, l_segment=1e-05, init_length=1e16),
+    ],
+    ids=["typical", "extreme-floats"],
+)
+def test_json_backend_parity(
+    params: FractalTreeParameters,
+    monkeypatch: pytest.MonkeyPatch,
+    backend: str,
+):
+    from purkinje_uv import fractal_tree_parameters as ftp
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(ftp, "orjson", None)
+
+    # Only parsed values are backend-independent; float spelling is not.
+    for indent in (2, None):
+        s = params.to_json(indent=indent)
+        assert ("\n" in s) is (indent is not None)
+        assert json.loads(s) == params.to_dict()
+        assert FractalTreeParameters.from_json(s) == params
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson"])
+def test_json_backends_accept_same_inputs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+    backend: str,
+):
+    from purkinje_uv import fractal_tree_parameters as ftp
 
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(ftp, "orjson", None)
 
-def test_parameters_invalid_negative_ids():
-    with pytest.raises(TypeError):
-        FractalTreeParameters(init_node_id=-1)
+    # numpy arrays are not JSON on either backend
+    p = replace(
+        _ROUNDTRIP_PARAMS, fascicles_angles=np.array([-0.3, 0.6]), _log_init=False
+    )
     with pytest.raises(TypeError):
-        FractalTreeParameters(second_node_id=-2)
+        p.to_json()
 
+    # from_json_file parses exactly like from_json
+    path = tmp_path_factory.mktemp("params") / "params.json"
+    path.write_text(_JSON_COMPACT, encoding="utf-8")
+    assert FractalTreeParameters.from_json_file(str(path)) == _ROUNDTRIP_PARAMS
+    bad = _JSON_COMPACT.replace('"w":0.05', '"w":NaN')
+    assert bad != _JSON_COMPACT
+    path.write_text(bad, encoding="utf-8")
+    with pytest.raises(ValueError) as from_text:
+        FractalTreeParameters.from_json(bad)
+    with pytest.raises(ValueError) as from_file:
+        FractalTreeParameters.from_json_file(str(path))
+    assert type(from_file.value) is type(from_text.value)
 
-def test_parameters_invalid_lengths_and_angle():
-    with pytest.raises(ValueError):
-        FractalTreeParameters(init_length=0.0)  # must be > 0
-    with pytest.raises(ValueError):
-        FractalTreeParameters(length=-0.1)  # must be > 0
-    with pytest.raises(ValueError):
-        FractalTreeParameters(w=-0.01)  # must be >= 0
-    with pytest.raises(ValueError):
-        FractalTreeParameters(l_segment=0.2, init_length=0.1, length=0.15)
-    with pytest.raises(ValueError):
-        FractalTreeParameters(branch_angle=0.0)
-    with pytest.raises(ValueError):
-        FractalTreeParameters(branch_angle=math.pi + 1.0)
 
+@pytest.mark.parametrize(
+    "s,multiline",
+    [(_JSON_PRETTY, True), (_JSON_COMPACT, False)],
+    ids=["pretty", "compact"],
+)
+def test_to_json_roundtrip(s: str, multiline: bool):
+    # Compact JSON (indent=None) is a single line
+    assert ("\n" in s) is multiline
+    assert FractalTreeParameters.from_json(s) == _ROUNDTRIP_PARAMS
 
-def test_parameters_invalid_fascicles_mismatch_and_values():
-    # Mismatch in list lengths
-    with pytest.raises(ValueError):
-        FractalTreeParameters(fascicles_angles=[0.1], fascicles_length=[])
 
-    # Nonpositive fascicle length
-    with pytest.raises(ValueError):
-        FractalTreeParameters(fascicles_angles=[0.1], fascicles_length=[0.0])
+def test_msgpack_roundtrip(roundtrip_params: FractalTreeParameters):
+    pytest.importorskip("msgpack")
+    p = roundtrip_params
 
-    # Non-finite angle
-    with pytest.raises(TypeError):
-        FractalTreeParameters(fascicles_angles=[float("nan")], fascicles_length=[0.1])
+    b = p.to_msgpack()
+    assert isinstance(b, bytes)
+    assert FractalTreeParameters.from_msgpack(b) == p
 
 
-def test_to_dict_and_json_roundtrip():
-    lseg = 0.01
-    p = FractalTreeParameters(
-        meshfile="mesh.obj",
-        init_node_id=2,
-        second_node_id=3,
-        init_length=0.25,
-        N_it=8,
-        length=0.12,
-        branch_angle=0.2,
-        w=0.05,
-        l_segment=lseg,
-        fascicles_angles=[-0.3, 0.6],
-        fascicles_length=[20 * lseg, 40 * lseg],
-    )
+def test_preloaded_mesh_not_serialized_or_compared():
+    mesh = object()  # any runtime object; the field is never serialized
+    p = FractalTreeParameters(meshfile="mesh.obj", mesh=mesh)
 
-    # dict contains all public fields and is JSON-serializable
-    d = p.to_dict()
-    assert isinstance(d, dict)
-    assert d["meshfile"] == "mesh.obj"
-    assert d["fascicles_angles"] == [-0.3, 0.6]
-    assert d["fascicles_length"] == [0.2, 0.4]
+    assert p.mesh is mesh
+    assert "mesh" not in p.to_dict()
+    assert "mesh" not in json.loads(p.to_json())
+    assert p == FractalTreeParameters(meshfile="mesh.obj")
 
-    # json -> object round-trip preserves equality
-    s = p.to_json()
-    p2 = FractalTreeParameters.from_json(s)
-    assert p2 == p
 
-    # Also test compact JSON (indent=None) parses back equivalently
-    s_compact = p.to_json(indent=None)
-    assert "\n" not in s_compact
-    p3 = FractalTreeParameters.from_json(s_compact)
-    assert p3 == p
-
-
-def test_to_json_file_and_from_dict_ignore_unknown(
-    tmp_path: Path, caplog: pytest.LogCaptureFixture
-):
+def test_json_file_roundtrip(tmp_path_factory: pytest.TempPathFactory):
     p = FractalTreeParameters(init_node_id=10, second_node_id=11, meshfile="m.obj")
 
-    # Write to file and read back via from_json
-    path = tmp_path / "params.json"
+    # Write to file and read back via from_json_file
+    path = tmp_path_factory.mktemp("params") / "params.json"
     p.to_json_file(str(path))
-    data = path.read_text(encoding="utf-8")
-    p_loaded = FractalTreeParameters.from_json(data)
+    p_loaded = FractalTreeParameters.from_json_file(str(path))
     assert p_loaded == p
 
+
+def test_from_dict_ignores_unknown(caplog: pytest.LogCaptureFixture):
+    p = FractalTreeParameters(init_node_id=10, second_node_id=11, meshfile="m.obj")
+
     # Inject unknown key and use from_dict; should warn and ignore
-    caplog.set_level(logging.WARNING, logger="purkinje_uv.fractal_tree_parameters")
+    caplog.set_level(logging.WARNING, logger=_PARAMS_LOGGER)
     d = p.to_dict()
     d["unknown_key"] = 123  # should be ignored
     p_ignored = FractalTreeParameters.from_dict(d)
@@ -151,9 +300,19 @@ def test_to_json_file_and_from_dict_ignore_unknown(
     assert "Ignoring unknown parameter keys" in caplog.text
 
 
+def test_from_dict_ignores_runtime_keys(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING, logger=_PARAMS_LOGGER)
+    p = FractalTreeParameters.from_dict(
+        {"meshfile": "heart.obj", "mesh": "heart.obj", "_log_init": False}
+    )
+    assert p.mesh is None
+    assert p._log_init is True
+    assert "Ignoring runtime-only parameter keys" in caplog.text
+
+
 def test_logging_on_init(caplog: pytest.LogCaptureFixture):
     # Ensure INFO/DEBUG messages are captured from the module's logger
-    caplog.set_level(logging.DEBUG, logger="purkinje_uv.fractal_tree_parameters")
+    caplog.set_level(logging.DEBUG, logger=_PARAMS_LOGGER)
 
     _ = FractalTreeParameters(
         meshfile="mesh.obj",
@@ -163,12 +322,42 @@ def test_logging_on_init(caplog: pytest.LogCaptureFixture):
         fascicles_length=[0.05],
     )
 
-    # Summary at INFO
-    assert "Initialized FractalTreeParameters" in caplog.text
+    # caplog.text re-reads the capture stream on every access; read it once.
+    text = caplog.text
+    fragments = (
+        "Initialized FractalTreeParameters",  # summary at INFO
+        "FractalTreeParameters full config:",  # full config at DEBUG
+        # A small sanity check that some numeric fields appear in the summary
+        "init_node_id=1",
+        "second_node_id=2",
+    )
+    missing = [f for f in fragments if f not in text]
+    assert not missing, f"missing log fragments: {missing}"
+
+
+def test_debug_config_lazy(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+):
+    # At INFO the DEBUG full-config line must not format the instance at all
+    caplog.set_level(logging.INFO, logger=_PARAMS_LOGGER)
+
+    def _boom(self):
+        raise AssertionError("full config formatted below DEBUG")
 
-    # Full config at DEBUG
-    assert "FractalTreeParameters full config:" in caplog.text
+    monkeypatch.setattr(FractalTreeParameters, "__repr__", _boom)
+
+    _ = FractalTreeParameters(meshfile="mesh.obj")
+    assert "FractalTreeParameters full config:" not in caplog.text
+
+
+def test_log_init_false_skips_info_summary(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.INFO, logger=_PARAMS_LOGGER)
+
+    base = FractalTreeParameters()
+    _ = replace(base, init_length=0.05, _log_init=False)
 
-    # A small sanity check that some numeric fields appear in the summary line
-    assert "init_node_id=1" in caplog.text
-    assert "second_node_id=2" in caplog.text
+    summaries = [
+        r for r in caplog.records if "Initialized FractalTreeParameters" in r.message
+    ]
+    assert len(summaries) == 1
+    assert "_log_init" not in base.to_dict()
@@ -0,0 +1,97 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from purkinje_uv.fractal_tree_parameters import FractalTreeParameters
+from purkinje_uv.mesh import Mesh
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT = REPO_ROOT / "scripts" / "validate_purkinje_uv_smoke.py"
+
+
+@pytest.fixture(scope="module")
+def smoke():
+    """The smoke-test script, imported as a module (scripts/ is not a package)."""
+    spec = importlib.util.spec_from_file_location("validate_purkinje_uv_smoke", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Default seeds on the bundled meshes; changing them changes every default run.
+PCA_SEEDS = [
+    ("crtdemo/crtdemo_LVendo_heart_cut.obj", (3, 173)),
+    ("crtdemo/crtdemo_RVendo_heart_cut.obj", (206, 645)),
+    ("ellipsoid.obj", (0, 577)),
+]
+
+
+@pytest.mark.parametrize("relpath,expected", PCA_SEEDS, ids=[p for p, _ in PCA_SEEDS])
+def test_pca_seed_vertices_pinned(smoke, relpath: str, expected: tuple[int, int]):
+    verts = Mesh(filename=str(REPO_ROOT / "data" / relpath)).verts
+    assert smoke.pca_seed_vertices(verts) == expected
+
+
+def test_pca_seed_vertices_invariant_to_reflection(smoke):
+    # A point reflection keeps the covariance (and the eigenvector the solver
+    # returns) but flips every projection; the seeds are geometric, so the
+    # orientation rule must pick the same vertices.
+    verts = Mesh(filename=str(REPO_ROOT / "data" / "ellipsoid.obj")).verts
+    assert smoke.pca_seed_vertices(-verts) == smoke.pca_seed_vertices(verts)
+
+
+class _FakeTree:
+    """FractalTree stand-in: fails 'out of the domain' above ``fit`` scale."""
+
+    fit = 0.85
+    error_in: tuple[float, float] | None = None  # non-domain error in (lo, hi)
+    scales: list[float] = []
+
+    def __init__(self, params: FractalTreeParameters):
+        self.scale = params.init_length / _BASE.init_length
+        self.nodes_xyz, self.connectivity, self.end_nodes = [], [], []
+
+    def grow_tree(self) -> None:
+        type(self).scales.append(self.scale)
+        if self.error_in is not None and (
+            self.error_in[0] < self.scale < self.error_in[1]
+        ):
+            raise ValueError("boom")
+        if self.scale > self.fit + 1e-12:
+            raise RuntimeError("the fascicle goes out of the domain")
+
+
+_BASE = FractalTreeParameters(init_length=1.0, length=1.0, l_segment=0.1)
+
+
+@pytest.fixture
+def fake_tree(smoke, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(smoke, "FractalTree", _FakeTree)
+    monkeypatch.setattr(_FakeTree, "scales", [])
+    return _FakeTree
+
+
+def test_grow_with_retry_returns_first_fit_by_default(smoke, fake_tree):
+    p, _ = smoke.grow_with_retry(_BASE, label="T", shrink=0.85)
+    assert fake_tree.scales == pytest.approx([1.0, 0.85])
+    assert p.init_length == pytest.approx(0.85)
+
+
+def test_grow_with_retry_keeps_fit_when_refinement_errors(
+    smoke, fake_tree, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(fake_tree, "error_in", (0.9, 0.95))
+    p, _ = smoke.grow_with_retry(_BASE, label="T", shrink=0.85, refine_tol=0.01)
+    # 1.0 fails (domain), 0.85 fits, 0.925 hits the unexpected error
+    assert fake_tree.scales == pytest.approx([1.0, 0.85, 0.925])
+    assert p.init_length == pytest.approx(0.85)
+
+
+def test_grow_with_retry_raises_unexpected_error_without_fit(
+    smoke, fake_tree, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(fake_tree, "error_in", (0.0, 2.0))
+    with pytest.raises(ValueError, match="boom"):
+        smoke.grow_with_retry(_BASE, label="T")